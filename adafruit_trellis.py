@@ -64,44 +64,24 @@ _HT16K33_CMD_BRIGHTNESS = const(0xE0)
 _HT16K33_KEY_READ_CMD = const(0x40)
 
 # LED Lookup Table
-ledLUT = (
-    0x3A,
-    0x37,
-    0x35,
-    0x34,
-    0x28,
-    0x29,
-    0x23,
-    0x24,
-    0x16,
-    0x1B,
-    0x11,
-    0x10,
-    0x0E,
-    0x0D,
-    0x0C,
-    0x02,
-)
+ledLUT = b"\x3a\x37\x35\x34\x28\x29\x23\x24\x16\x1b\x11\x10\x0e\x0d\x0c\x02"  # pylint: disable=invalid-name
 
 # Button Loookup Table
-buttonLUT = (
-    0x07,
-    0x04,
-    0x02,
-    0x22,
-    0x05,
-    0x06,
-    0x00,
-    0x01,
-    0x03,
-    0x10,
-    0x30,
-    0x21,
-    0x13,
-    0x12,
-    0x11,
-    0x31,
+buttonLUT = b"\x07\x04\x02\x22\x05\x06\x00\x01\x03\x10\x30\x21\x13\x12\x11\x31"  # pylint: disable=invalid-name
+
+# LED buffer byte offset and bit mask for each LED, unpacked from ledLUT
+_LED_BYTE = bytes(
+    ((ledLUT[x] >> 4) * 2) + 1 + ((ledLUT[x] & 0x0F) >> 3) for x in range(16)
 )
+_LED_BIT = bytes(1 << (ledLUT[x] & 0x07) for x in range(16))
+
+# Key register byte offset and bit mask for each button, unpacked from buttonLUT
+_BTN_BYTE = bytes(buttonLUT[x] >> 4 for x in range(16))
+_BTN_MASK = bytes(1 << (buttonLUT[x] & 0x0F) for x in range(16))
+
+# LED register contents for every LED on or off
+_FILL_ON = b"\xff" * 16
+_FILL_OFF = b"\x00" * 16
 
 
 # pylint: disable=missing-docstring, protected-access
@@ -110,48 +90,40 @@ class TrellisLEDs:
         self._parent = trellis_obj
 
     def __getitem__(self, x: int) -> bool:
-        if 0 < x >= self._parent._num_leds:
+        if not 0 <= x < self._parent._num_leds:
             raise ValueError(
                 ("LED number must be between 0 -", self._parent._num_leds - 1)
             )
-        led = ledLUT[x % 16] >> 4
-        mask = 1 << (ledLUT[x % 16] & 0x0F)
-        return bool(
-            (
-                (
-                    self._parent._led_buffer[x // 16][(led * 2) + 1]
-                    | self._parent._led_buffer[x // 16][(led * 2) + 2] << 8
-                )
-                & mask
-            )
-            > 0
-        )
+        buff = self._parent._led_buffer[x >> 4]
+        x &= 0x0F
+        return bool(buff[_LED_BYTE[x]] & _LED_BIT[x])
 
     def __setitem__(self, x: int, value: bool) -> None:
-        if 0 < x >= self._parent._num_leds:
+        if not 0 <= x < self._parent._num_leds:
             raise ValueError(
                 ("LED number must be between 0 -", self._parent._num_leds - 1)
             )
-        led = ledLUT[x % 16] >> 4
-        mask = 1 << (ledLUT[x % 16] & 0x0F)
+        board = x >> 4
+        buff = self._parent._led_buffer[board]
+        x &= 0x0F
+        i = _LED_BYTE[x]
+        old = buff[i]
         if value:
-            self._parent._led_buffer[x // 16][(led * 2) + 1] |= mask & 0xFF
-            self._parent._led_buffer[x // 16][(led * 2) + 2] |= mask >> 8
-        elif not value:
-            self._parent._led_buffer[x // 16][(led * 2) + 1] &= ~mask
-            self._parent._led_buffer[x // 16][(led * 2) + 2] &= ~mask >> 8
+            buff[i] = old | _LED_BIT[x]
         else:
-            raise ValueError("LED value must be True or False")
+            buff[i] = old & ~_LED_BIT[x] & 0xFF
+        if buff[i] != old:
+            self._parent._dirty[board] = True
 
         if self._parent._auto_show:
             self._parent.show()
 
     # pylint: disable=invalid-name
     def fill(self, on: bool) -> None:
-        fill = 0xFF if on else 0x00
-        for buff in range(len(self._parent._i2c_devices)):
-            for i in range(1, 17):
-                self._parent._led_buffer[buff][i] = fill
+        fill = _FILL_ON if on else _FILL_OFF
+        for pos, buff in enumerate(self._parent._led_buffer):
+            buff[1:] = fill
+            self._parent._dirty[pos] = True
         if self._parent._auto_show:
             self._parent.show()
 
@@ -159,7 +131,9 @@ class TrellisLEDs:
 # pylint: enable=missing-docstring, protected-access
 
 
-class Trellis:
+# the shared bus and board addresses are kept alongside the per-board
+# I2CDevices so show() can write every board under a single bus lock
+class Trellis:  # pylint: disable=too-many-instance-attributes
     """
     Driver base for a single Trellis Board
 
@@ -168,6 +142,7 @@ class Trellis:
     :param list addresses: The I2C address(es) of the Trellis board(s) you're using. Defaults
                            to ``[0x70]`` which is the default address for Trellis boards. See
                            Trellis product guide for using different/multiple I2C addresses.
+                           Each address may only be given once.
                            https://learn.adafruit.com/adafruit-trellis-diy-open-source-led-keypad
 
 
@@ -180,17 +155,27 @@ class Trellis:
     def __init__(self, i2c: I2C, addresses: Optional[List[int]] = None) -> None:
         if addresses is None:
             addresses = [0x70]
+        self._i2c = i2c
+        self._addresses = []
         self._i2c_devices = []
         self._led_buffer = []
+        self._dirty = []
         self._buttons = []
+        seen = set()
         for i2c_address in addresses:
+            if i2c_address in seen:
+                raise ValueError(f"Duplicate I2C address: {hex(i2c_address)}")
+            seen.add(i2c_address)
+            self._addresses.append(i2c_address)
             self._i2c_devices.append(i2c_device.I2CDevice(i2c, i2c_address))
             self._led_buffer.append(bytearray(17))
-            self._buttons.append([bytearray(6), bytearray(6)])
+            self._dirty.append(False)
+            # last keys, current keys, pressed edges, released edges
+            self._buttons.append([bytearray(6) for _ in range(4)])
         self._num_leds = len(self._i2c_devices) * 16
         self._temp = bytearray(1)
-        self._blink_rate = None
-        self._brightness = None
+        self._blink_rate = 0
+        self._brightness = 15
         self._auto_show = True
         self.led = TrellisLEDs(self)
         """
@@ -202,15 +187,23 @@ class Trellis:
         - ``trellis.led.fill(bool)`` turns every LED on (True) or off (False)
         """
         self.led.fill(False)
-        self._write_cmd(_HT16K33_OSCILATOR_ON)
-        self.blink_rate = 0
-        self.brightness = 15
+        for device in self._i2c_devices:
+            with device:
+                self._write_cmd_nolock(device, _HT16K33_OSCILATOR_ON)
+                self._write_cmd_nolock(
+                    device, _HT16K33_BLINK_CMD | _HT16K33_BLINK_DISPLAYON
+                )
+                self._write_cmd_nolock(device, _HT16K33_CMD_BRIGHTNESS | 0x0F)
 
     def _write_cmd(self, byte: int) -> None:
-        self._temp[0] = byte
         for device in self._i2c_devices:
             with device:
-                device.write(self._temp)
+                self._write_cmd_nolock(device, byte)
+
+    def _write_cmd_nolock(self, device: i2c_device.I2CDevice, byte: int) -> None:
+        # caller must already hold ``device``
+        self._temp[0] = byte
+        device.write(self._temp)
 
     @property
     def blink_rate(self) -> Literal[0, 1, 2, 3]:
@@ -242,14 +235,24 @@ class Trellis:
         self._brightness = brightness
         self._write_cmd(_HT16K33_CMD_BRIGHTNESS | brightness)
 
-    def show(self) -> None:
-        """Refresh the LED buffer and show the changes."""
-        pos = 0
-        for device in self._i2c_devices:
-            temp_led_buffer = bytearray(self._led_buffer[pos])
-            with device:
-                device.write(temp_led_buffer)
-            pos += 1
+    def show(self, force: bool = False) -> None:
+        """
+        Refresh the LED buffer and show the changes. Boards whose LEDs have not
+        changed since the last refresh are skipped unless ``force`` is ``True``.
+        """
+        if not force and True not in self._dirty:
+            return
+        # every board shares one bus, so lock it once for all of the writes
+        # instead of acquiring each board's I2CDevice in turn
+        while not self._i2c.try_lock():
+            pass
+        try:
+            for pos, i2c_address in enumerate(self._addresses):
+                if force or self._dirty[pos]:
+                    self._i2c.writeto(i2c_address, self._led_buffer[pos])
+                    self._dirty[pos] = False
+        finally:
+            self._i2c.unlock()
 
     @property
     def auto_show(self) -> bool:
@@ -270,36 +273,32 @@ class Trellis:
         Read the button matrix register on the Trellis board(s). Returns two
         lists: 1 for new button presses, 1 for button relases.
         """
-        for i in range(len(self._buttons)):  # pylint: disable=consider-using-enumerate
-            self._buttons[i][0] = bytearray(self._buttons[i][1])
-        self._write_cmd(_HT16K33_KEY_READ_CMD)
+        self._temp[0] = _HT16K33_KEY_READ_CMD
+        # bind the hot-loop tables to locals, which the bytecode interpreter
+        # loads much faster than globals
+        btn_byte = _BTN_BYTE
+        btn_mask = _BTN_MASK
+        pressed = []
+        released = []
         pos = 0
         for device in self._i2c_devices:
+            buttons = self._buttons[pos]
+            # swap the buffers so the previous read becomes the "last" state
+            buttons[0], buttons[1] = buttons[1], buttons[0]
             with device:
-                device.readinto(self._buttons[pos][1])
-                pos += 1
-        pressed = []
-        released = []
-        for i in range(self._num_leds):
-            if self._just_pressed(i):
-                pressed.append(i)
-            elif self._just_released(i):
-                released.append(i)
+                device.write_then_readinto(self._temp, buttons[1])
+            last, current, pressed_edge, released_edge = buttons
+            # boards with no key changes have no edges to report
+            if current != last:
+                for k in range(6):
+                    pressed_edge[k] = current[k] & ~last[k]
+                    released_edge[k] = last[k] & ~current[k]
+                for i in range(16):
+                    byte = btn_byte[i]
+                    if pressed_edge[byte] & btn_mask[i]:
+                        pressed.append((pos << 4) + i)
+                    elif released_edge[byte] & btn_mask[i]:
+                        released.append((pos << 4) + i)
+            pos += 1
 
         return pressed, released
-
-    def _is_pressed(self, button: int) -> bool:
-        mask = 1 << (buttonLUT[button % 16] & 0x0F)
-        return self._buttons[button // 16][1][(buttonLUT[button % 16] >> 4)] & mask
-
-    def _was_pressed(self, button: int) -> bool:
-        mask = 1 << (buttonLUT[button % 16] & 0x0F)
-        return self._buttons[button // 16][0][(buttonLUT[button % 16] >> 4)] & mask
-
-    def _just_pressed(self, button: int) -> bool:
-        # pylint: disable=invalid-unary-operand-type
-        return self._is_pressed(button) & ~self._was_pressed(button)
-
-    def _just_released(self, button: int) -> bool:
-        # pylint: disable=invalid-unary-operand-type
-        return ~self._is_pressed(button) & self._was_pressed(button)